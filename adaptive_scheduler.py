@@ -0,0 +1,158 @@
+import sys
+import json
+import os
+import random
+
+# Agendador adaptativo de questões.
+# Cada questão recebe um peso calculado a partir do histórico de acertos/erros.
+# As questões de uma sessão são sorteadas sem reposição proporcionalmente ao
+# peso, usando uma Fenwick tree (O(log n) por sorteio).
+# O mesmo algoritmo existe no lado da página em scheduler.js. O histórico é
+# gravado pela página (IndexedDB) e exportado por ela no botão "Exportar
+# Histórico" como neuroquiz_profile.json, que é o perfil lido aqui.
+
+DEFAULT_PROFILE = 'neuroquiz_profile.json'
+
+# Limites do peso: nunca zera uma questão (ela ainda pode voltar a aparecer)
+# e não deixa uma questão muito errada monopolizar a sessão.
+MIN_WEIGHT = 0.05
+MAX_WEIGHT = 8.0
+UNSEEN_WEIGHT = 1.0
+
+
+class FenwickTree:
+    def __init__(self, weights):
+        self.n = len(weights)
+        self.weights = [float(w) for w in weights]
+        self.tree = [0.0] * (self.n + 1)
+        # Construção em O(n): cada nó repassa sua soma para o pai
+        for i in range(1, self.n + 1):
+            self.tree[i] += self.weights[i - 1]
+            parent = i + (i & -i)
+            if parent <= self.n:
+                self.tree[parent] += self.tree[i]
+        self.total = sum(self.weights)
+        # Maior potência de 2 <= n, ponto de partida da busca binária
+        self.top_bit = 1 << (self.n.bit_length() - 1) if self.n else 0
+
+    def update(self, index, new_weight):
+        delta = new_weight - self.weights[index]
+        self.weights[index] = new_weight
+        self.total += delta
+        i = index + 1
+        while i <= self.n:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, target):
+        # Retorna o menor índice cuja soma acumulada ultrapassa target
+        pos = 0
+        step = self.top_bit
+        while step:
+            nxt = pos + step
+            if nxt <= self.n and self.tree[nxt] <= target:
+                pos = nxt
+                target -= self.tree[nxt]
+            step >>= 1
+        return min(pos, self.n - 1)
+
+    def sample(self, rng=random):
+        # Sorteia um índice proporcional ao peso e o remove (peso -> 0)
+        if self.total <= 0:
+            return None
+        index = self.find(rng.random() * self.total)
+        # Erros de ponto flutuante podem cair em um índice já removido
+        while index > 0 and self.weights[index] <= 0:
+            index -= 1
+        if self.weights[index] <= 0:
+            return None
+        self.update(index, 0.0)
+        return index
+
+
+def question_key(theme, question):
+    # IDs só são únicos dentro de um tema no quiz_neurologia.json
+    return f"{theme}::{question.get('id')}"
+
+
+def question_weight(stats):
+    # Valores malformados (ex.: um número no lugar do dict) contam como não vistos
+    if not isinstance(stats, dict) or not stats.get('seen'):
+        return UNSEEN_WEIGHT
+    correct = stats.get('correct', 0)
+    incorrect = stats.get('incorrect', 0)
+    streak = stats.get('streak', 0)
+    if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in (correct, incorrect, streak)):
+        return UNSEEN_WEIGHT
+    # Mais erros aumentam o peso; acertos seguidos o derrubam rapidamente
+    weight = (incorrect + 1) / (correct + 1) * (0.5 ** streak)
+    return max(MIN_WEIGHT, min(MAX_WEIGHT, weight))
+
+
+def load_profile(path=DEFAULT_PROFILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        profile = json.load(f)
+    if not isinstance(profile, dict):
+        print(f"Warning: {path} is not a JSON object, ignoring profile.")
+        return {}
+    return profile
+
+
+def weighted_sample(items, weights, k, rng=random):
+    # Sorteio ponderado sem reposição: O(n) para montar, O(k log n) para sortear
+    tree = FenwickTree(weights)
+    selected = []
+    while len(selected) < k:
+        index = tree.sample(rng)
+        if index is None:
+            break
+        selected.append(items[index])
+    return selected
+
+
+def iter_bank(bank):
+    # Aceita os dois formatos usados pelo index.html:
+    # {"categorias": [{"nome", "questoes"}]} ou {"Tema": [questões]}
+    if isinstance(bank.get('categorias'), list):
+        for cat in bank['categorias']:
+            for q in cat.get('questoes', []):
+                yield cat['nome'], q
+    else:
+        for theme, questions in bank.items():
+            for q in questions:
+                yield theme, q
+
+
+def schedule_session(bank, profile, k, rng=random):
+    items = []
+    weights = []
+    for theme, q in iter_bank(bank):
+        key = question_key(theme, q)
+        items.append(key)
+        weights.append(question_weight(profile.get(key)))
+    return weighted_sample(items, weights, k, rng)
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: python adaptive_scheduler.py <bank.json> <num_questions> [profile.json]")
+        sys.exit(1)
+
+    bank_path = sys.argv[1]
+    num_questions = int(sys.argv[2])
+    profile_path = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_PROFILE
+
+    with open(bank_path, 'r', encoding='utf-8') as f:
+        bank = json.load(f)
+    profile = load_profile(profile_path)
+
+    session = schedule_session(bank, profile, num_questions)
+    for key in session:
+        stats = profile.get(key)
+        print(f"{key}\t(peso {question_weight(stats):.2f})")
+    print(f"{len(session)} questões selecionadas.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+import sys
+import os
+import re
+import json
+import gzip
+import shutil
+import hashlib
+import subprocess
+
+# Build estático para uso offline.
+# Gera em dist/:
+#   - CSS do Tailwind compilado (substitui o script do CDN)
+#   - cópias com hash de conteúdo no nome (assets/*.<hash>.*), cacheáveis para sempre
+#   - o banco padrão dividido em shards por categoria
+#   - asset-manifest.json, lido pelo service worker (sw.js) para o precache
+#   - versões .gz (e .br, se o módulo brotli estiver instalado) para servidores
+#     que servem arquivos pré-comprimidos (ex.: nginx gzip_static)
+
+OUTPUT_DIR = 'dist'
+ASSETS_DIR = 'assets'
+DEFAULT_BANK = 'banco_piloto_ten_abn.json'
+TAILWIND_CDN_TAG = '<script src="https://cdn.tailwindcss.com"></script>'
+SCHEDULER_IMPORT = "import('./scheduler.js')"
+COMPRESSIBLE = ('.html', '.css', '.js', '.json')
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def slugify(text):
+    text = text.lower()
+    text = re.sub(r'[^a-z0-9]+', '-', text)
+    return text.strip('-') or 'tema'
+
+
+def write_hashed(data, name, subdir=ASSETS_DIR):
+    # Grava data em dist/<subdir>/<nome>.<hash>.<ext> e retorna o caminho relativo
+    base, ext = os.path.splitext(name)
+    rel_path = f"{subdir}/{base}.{content_hash(data)}{ext}"
+    write_file(rel_path, data)
+    return rel_path
+
+
+def write_file(rel_path, data):
+    path = os.path.join(OUTPUT_DIR, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+    if rel_path.endswith(COMPRESSIBLE):
+        # mtime=0 deixa o .gz reprodutível entre builds
+        with open(path + '.gz', 'wb') as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli:
+            with open(path + '.br', 'wb') as f:
+                f.write(brotli.compress(data))
+
+
+def build_css():
+    # Requer o CLI do Tailwind v3 (binário standalone ou via npx)
+    tailwind = shutil.which('tailwindcss')
+    if tailwind:
+        cmd = [tailwind]
+    elif shutil.which('npx'):
+        cmd = ['npx', '--yes', 'tailwindcss@3']
+    else:
+        print("Error: tailwindcss CLI not found (install the standalone binary or Node.js).")
+        sys.exit(1)
+
+    cmd += ['-i', 'styles.css', '--content', 'index.html,scheduler.js', '--minify']
+    result = subprocess.run(cmd, capture_output=True)
+    if result.returncode != 0:
+        print(result.stderr.decode('utf-8', errors='replace'))
+        print("Error: Tailwind build failed.")
+        sys.exit(1)
+    return result.stdout
+
+
+def build_bank_shards(bank_path):
+    # Um shard por categoria: o navegador baixa em paralelo e cada um é
+    # revalidado de forma independente quando o banco muda
+    with open(bank_path, 'r', encoding='utf-8') as f:
+        bank = json.load(f)
+
+    if isinstance(bank.get('categorias'), list):
+        groups = [(cat['nome'], {'categorias': [cat]}) for cat in bank['categorias']]
+    else:
+        groups = [(theme, {theme: questions}) for theme, questions in bank.items()]
+
+    shards = []
+    for i, (name, shard) in enumerate(groups):
+        data = json.dumps(shard, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        url = write_hashed(data, f"{i:02d}-{slugify(name)}.json", f"{ASSETS_DIR}/bank")
+        shards.append({'nome': name, 'url': url})
+    return shards
+
+
+def main():
+    bank_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_BANK
+
+    # Sem o banco, "Carregar Banco Padrão" não funcionaria offline
+    if not os.path.exists(bank_path):
+        print(f"Error: {bank_path} not found.")
+        print("Usage: python build_assets.py [bank.json]")
+        sys.exit(1)
+
+    if os.path.exists(OUTPUT_DIR):
+        shutil.rmtree(OUTPUT_DIR)
+
+    assets = {}
+
+    print("Building CSS...")
+    assets['styles.css'] = write_hashed(build_css(), 'styles.css')
+
+    with open('scheduler.js', 'rb') as f:
+        assets['scheduler.js'] = write_hashed(f.read(), 'scheduler.js')
+
+    print("Sharding bank...")
+    shards = build_bank_shards(bank_path)
+
+    # index.html e sw.js mantêm URLs fixas; só as referências internas mudam
+    with open('index.html', 'r', encoding='utf-8') as f:
+        html = f.read()
+    if TAILWIND_CDN_TAG not in html:
+        print("Error: Tailwind CDN tag not found in index.html.")
+        sys.exit(1)
+    if SCHEDULER_IMPORT not in html:
+        print(f"Error: {SCHEDULER_IMPORT} not found in index.html.")
+        sys.exit(1)
+    html = html.replace(TAILWIND_CDN_TAG, f'<link rel="stylesheet" href="{assets["styles.css"]}">')
+    html = html.replace(SCHEDULER_IMPORT, f"import('./{assets['scheduler.js']}')")
+    write_file('index.html', html.encode('utf-8'))
+
+    with open('sw.js', 'rb') as f:
+        write_file('sw.js', f.read())
+
+    precache = ['./', 'index.html'] + sorted(assets.values()) + [s['url'] for s in shards]
+    version = content_hash('\n'.join(precache).encode('utf-8') + html.encode('utf-8'))
+    manifest = {
+        'version': version,
+        'assets': assets,
+        'bank': shards,
+        'precache': precache
+    }
+    write_file('asset-manifest.json', json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8'))
+
+    print(f"Built {len(precache)} precached files ({len(shards)} bank shards) into {OUTPUT_DIR}/")
+    print(f"Manifest version: {version}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+// Agendador adaptativo de questões (lado da página).
+// Mesmo algoritmo de adaptive_scheduler.py: peso por questão a partir do
+// histórico de acertos/erros, sorteio ponderado sem reposição via Fenwick tree.
+// O perfil fica salvo no IndexedDB do navegador e pode ser exportado/importado
+// como JSON (mesmo formato de neuroquiz_profile.json, lido pelo lado Python).
+
+const DB_NAME = 'neuroquiz';
+const DB_VERSION = 1;
+const STORE_NAME = 'profile';
+
+const MIN_WEIGHT = 0.05;
+const MAX_WEIGHT = 8.0;
+const UNSEEN_WEIGHT = 1.0;
+
+export class FenwickTree {
+    constructor(weights) {
+        this.n = weights.length;
+        this.weights = Float64Array.from(weights);
+        this.tree = new Float64Array(this.n + 1);
+        // Construção em O(n): cada nó repassa sua soma para o pai
+        for (let i = 1; i <= this.n; i++) {
+            this.tree[i] += this.weights[i - 1];
+            const parent = i + (i & -i);
+            if (parent <= this.n) this.tree[parent] += this.tree[i];
+        }
+        this.total = this.weights.reduce((acc, w) => acc + w, 0);
+        this.topBit = 1;
+        while (this.topBit * 2 <= this.n) this.topBit *= 2;
+        if (this.n === 0) this.topBit = 0;
+    }
+
+    update(index, newWeight) {
+        const delta = newWeight - this.weights[index];
+        this.weights[index] = newWeight;
+        this.total += delta;
+        for (let i = index + 1; i <= this.n; i += i & -i) {
+            this.tree[i] += delta;
+        }
+    }
+
+    find(target) {
+        // Retorna o menor índice cuja soma acumulada ultrapassa target
+        let pos = 0;
+        for (let step = this.topBit; step > 0; step >>= 1) {
+            const next = pos + step;
+            if (next <= this.n && this.tree[next] <= target) {
+                pos = next;
+                target -= this.tree[next];
+            }
+        }
+        return Math.min(pos, this.n - 1);
+    }
+
+    sample() {
+        // Sorteia um índice proporcional ao peso e o remove (peso -> 0)
+        if (this.total <= 0) return null;
+        let index = this.find(Math.random() * this.total);
+        // Erros de ponto flutuante podem cair em um índice já removido
+        while (index > 0 && this.weights[index] <= 0) index--;
+        if (this.weights[index] <= 0) return null;
+        this.update(index, 0);
+        return index;
+    }
+}
+
+export function questionKey(theme, question) {
+    // IDs só são únicos dentro de um tema no quiz_neurologia.json
+    return `${theme}::${question.id}`;
+}
+
+export function questionWeight(stats) {
+    if (!stats || !stats.seen) return UNSEEN_WEIGHT;
+    const correct = stats.correct || 0;
+    const incorrect = stats.incorrect || 0;
+    const streak = stats.streak || 0;
+    // Mais erros aumentam o peso; acertos seguidos o derrubam rapidamente
+    const weight = (incorrect + 1) / (correct + 1) * Math.pow(0.5, streak);
+    return Math.max(MIN_WEIGHT, Math.min(MAX_WEIGHT, weight));
+}
+
+export function weightedSample(items, weights, k) {
+    // Sorteio ponderado sem reposição: O(n) para montar, O(k log n) para sortear
+    const tree = new FenwickTree(weights);
+    const selected = [];
+    while (selected.length < k) {
+        const index = tree.sample();
+        if (index === null) break;
+        selected.push(items[index]);
+    }
+    return selected;
+}
+
+let dbPromise = null;
+
+function openDb() {
+    // Conexão única, reaproveitada entre leituras e gravações
+    if (!dbPromise) {
+        dbPromise = new Promise((resolve, reject) => {
+            const request = indexedDB.open(DB_NAME, DB_VERSION);
+            request.onupgradeneeded = () => {
+                request.result.createObjectStore(STORE_NAME);
+            };
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => reject(request.error);
+        });
+    }
+    return dbPromise;
+}
+
+export async function loadProfile() {
+    // Retorna um objeto { chave: stats } com o histórico completo
+    const db = await openDb();
+    return new Promise((resolve, reject) => {
+        const profile = {};
+        const tx = db.transaction(STORE_NAME, 'readonly');
+        const request = tx.objectStore(STORE_NAME).openCursor();
+        request.onsuccess = () => {
+            const cursor = request.result;
+            if (cursor) {
+                profile[cursor.key] = cursor.value;
+                cursor.continue();
+            }
+        };
+        tx.oncomplete = () => resolve(profile);
+        tx.onerror = () => reject(tx.error);
+    });
+}
+
+export function recordAnswer(profile, key, isCorrect) {
+    const stats = profile[key] || { seen: 0, correct: 0, incorrect: 0, streak: 0 };
+    stats.seen++;
+    if (isCorrect) {
+        stats.correct++;
+        stats.streak++;
+    } else {
+        stats.incorrect++;
+        stats.streak = 0;
+    }
+    profile[key] = stats;
+    return stats;
+}
+
+export async function saveStats(key, stats) {
+    const db = await openDb();
+    return new Promise((resolve, reject) => {
+        const tx = db.transaction(STORE_NAME, 'readwrite');
+        tx.objectStore(STORE_NAME).put(stats, key);
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+    });
+}
+
+const STATS_FIELDS = ['seen', 'correct', 'incorrect', 'streak'];
+
+function isPlainObject(value) {
+    return value !== null && typeof value === 'object' && !Array.isArray(value);
+}
+
+export function validateProfile(data) {
+    // Valida um histórico importado: retorna só as entradas bem formadas e
+    // quantas foram ignoradas; lança erro se o arquivo não for um objeto
+    if (!isPlainObject(data)) throw new Error('O histórico deve ser um objeto JSON');
+
+    const entries = {};
+    let skipped = 0;
+    for (const [key, stats] of Object.entries(data)) {
+        const valid = isPlainObject(stats) &&
+            STATS_FIELDS.every(field => Number.isFinite(stats[field]) && stats[field] >= 0);
+        if (!valid) {
+            skipped++;
+            continue;
+        }
+        entries[key] = Object.fromEntries(STATS_FIELDS.map(field => [field, stats[field]]));
+    }
+    return { entries, skipped };
+}
+
+export async function saveProfile(entries) {
+    // Grava várias questões de uma vez (usado na importação do JSON)
+    const db = await openDb();
+    return new Promise((resolve, reject) => {
+        const tx = db.transaction(STORE_NAME, 'readwrite');
+        const store = tx.objectStore(STORE_NAME);
+        for (const [key, stats] of Object.entries(entries)) {
+            store.put(stats, key);
+        }
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+    });
+}
@@ -0,0 +1,135 @@
+// Service worker para uso offline.
+// Faz o precache dos arquivos listados em asset-manifest.json (gerado por
+// build_assets.py) e responde cache-first. Os assets têm hash no nome, então
+// nunca ficam desatualizados; a cada abertura da página o manifesto é
+// revalidado em segundo plano e, se a versão mudou, os arquivos novos são
+// baixados ao lado dos antigos. O novo manifesto fica pendente e só é
+// promovido (com a remoção dos arquivos antigos) na próxima abertura, para a
+// página já aberta continuar vendo uma versão consistente.
+
+const CACHE_NAME = 'neuroquiz-assets';
+const MANIFEST_URL = 'asset-manifest.json';
+// Chave interna do cache, nunca requisitada pela página
+const PENDING_MANIFEST_URL = 'asset-manifest.pending.json';
+// Fontes do Google: cache em tempo de execução, também cache-first. O CSS é
+// carregado com crossorigin, então erros aparecem em response.ok em vez de
+// ficarem escondidos numa resposta opaca
+const RUNTIME_HOSTS = ['fonts.googleapis.com', 'fonts.gstatic.com'];
+
+function scopeUrl(path) {
+    return new URL(path, self.registration.scope).href;
+}
+
+async function fetchManifest() {
+    const response = await fetch(MANIFEST_URL, { cache: 'no-store' });
+    if (!response.ok) throw new Error('Falha ao carregar o manifesto de assets');
+    return response;
+}
+
+async function precache(manifest) {
+    const cache = await caches.open(CACHE_NAME);
+
+    // Arquivos com hash já em cache não precisam ser baixados de novo;
+    // index.html e './' não têm hash e são sempre atualizados
+    const missing = [];
+    for (const path of manifest.precache) {
+        const hashed = path !== './' && path !== 'index.html';
+        if (!hashed || !(await cache.match(scopeUrl(path)))) missing.push(path);
+    }
+    await cache.addAll(missing.map(path => new Request(path, { cache: 'reload' })));
+}
+
+async function useManifest(manifestResponse) {
+    // Torna o manifesto o atual e remove os arquivos das versões anteriores
+    const manifest = await manifestResponse.clone().json();
+    const cache = await caches.open(CACHE_NAME);
+
+    const keep = new Set(manifest.precache.map(scopeUrl));
+    for (const request of await cache.keys()) {
+        const url = new URL(request.url);
+        if (url.origin === self.location.origin && !keep.has(request.url)) {
+            await cache.delete(request);
+        }
+    }
+
+    await cache.put(scopeUrl(MANIFEST_URL), manifestResponse);
+}
+
+async function promotePending() {
+    const cache = await caches.open(CACHE_NAME);
+    const pending = await cache.match(scopeUrl(PENDING_MANIFEST_URL));
+    if (pending) await useManifest(pending);
+}
+
+async function revalidate() {
+    try {
+        const cache = await caches.open(CACHE_NAME);
+        const current = await cache.match(scopeUrl(MANIFEST_URL));
+        const currentVersion = current ? (await current.json()).version : null;
+
+        const response = await fetchManifest();
+        const manifest = await response.clone().json();
+        if (manifest.version !== currentVersion) {
+            await precache(manifest);
+            await cache.put(scopeUrl(PENDING_MANIFEST_URL), response);
+        }
+    } catch (error) {
+        // Sem rede (ou manifesto indisponível): continua com a versão em cache
+    }
+}
+
+async function cacheFirst(request) {
+    const cache = await caches.open(CACHE_NAME);
+    const cached = await cache.match(request);
+    if (cached) return cached;
+
+    const response = await fetch(request);
+    if (response.ok) {
+        cache.put(request, response.clone());
+    }
+    return response;
+}
+
+self.addEventListener('install', (event) => {
+    event.waitUntil((async () => {
+        const response = await fetchManifest();
+        await precache(await response.clone().json());
+
+        // Atualização do próprio sw.js: a página aberta ainda usa a versão em
+        // cache, então o novo manifesto espera a próxima abertura
+        const cache = await caches.open(CACHE_NAME);
+        if (await cache.match(scopeUrl(MANIFEST_URL))) {
+            await cache.put(scopeUrl(PENDING_MANIFEST_URL), response);
+        } else {
+            await useManifest(response);
+        }
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(keys.filter(key => key !== CACHE_NAME).map(key => caches.delete(key))))
+            .then(() => self.clients.claim())
+    );
+});
+
+self.addEventListener('fetch', (event) => {
+    const request = event.request;
+    if (request.method !== 'GET') return;
+    const url = new URL(request.url);
+    const sameOrigin = url.origin === self.location.origin;
+    if (!sameOrigin && !RUNTIME_HOSTS.includes(url.hostname)) return;
+
+    if (request.mode === 'navigate') {
+        // Nova abertura da página: aplica a versão baixada na revalidação
+        // anterior e só então procura uma versão mais nova
+        const promoted = promotePending();
+        event.respondWith(promoted.then(() => cacheFirst(request)));
+        event.waitUntil(promoted.then(revalidate));
+        return;
+    }
+
+    event.respondWith(cacheFirst(request));
+});
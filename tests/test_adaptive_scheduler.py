@@ -0,0 +1,141 @@
+import json
+import random
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import adaptive_scheduler
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STATS_CASES = [
+    None,
+    {'seen': 0, 'correct': 0, 'incorrect': 0, 'streak': 0},
+    {'seen': 1, 'correct': 1, 'incorrect': 0, 'streak': 1},
+    {'seen': 3, 'correct': 0, 'incorrect': 3, 'streak': 0},
+    {'seen': 5, 'correct': 4, 'incorrect': 1, 'streak': 4},
+    {'seen': 20, 'correct': 0, 'incorrect': 20, 'streak': 0},
+]
+
+
+def test_sample_covers_every_item_once():
+    rng = random.Random(0)
+    for _ in range(500):
+        n = rng.randint(1, 40)
+        weights = [rng.uniform(0.01, 5) for _ in range(n)]
+        drawn = adaptive_scheduler.weighted_sample(list(range(n)), weights, n, rng)
+        assert sorted(drawn) == list(range(n))
+
+
+def test_sample_skips_zero_weights():
+    rng = random.Random(1)
+    weights = [0, 2, 0, 1, 0, 3, 0]
+    for _ in range(500):
+        drawn = adaptive_scheduler.weighted_sample(list(range(7)), weights, 7, rng)
+        assert sorted(drawn) == [1, 3, 5]
+
+
+def test_sample_empty_and_all_zero():
+    assert adaptive_scheduler.weighted_sample([], [], 3) == []
+    assert adaptive_scheduler.weighted_sample(['a', 'b'], [0, 0], 2) == []
+
+
+def test_first_draw_proportional_to_weight():
+    rng = random.Random(2)
+    weights = [1, 2, 3, 4]
+    counts = [0] * 4
+    trials = 20000
+    for _ in range(trials):
+        counts[adaptive_scheduler.weighted_sample(range(4), weights, 1, rng)[0]] += 1
+    for count, weight in zip(counts, weights):
+        assert abs(count / trials - weight / 10) < 0.02
+
+
+def test_question_weight_ordering():
+    weight = adaptive_scheduler.question_weight
+    assert weight(None) == adaptive_scheduler.UNSEEN_WEIGHT
+    assert weight(STATS_CASES[3]) > weight(None) > weight(STATS_CASES[2])
+    assert weight(STATS_CASES[4]) == adaptive_scheduler.MIN_WEIGHT
+    assert weight(STATS_CASES[5]) == adaptive_scheduler.MAX_WEIGHT
+
+
+def test_question_weight_malformed_stats_count_as_unseen():
+    weight = adaptive_scheduler.question_weight
+    for stats in (5, 'x', [1, 2], {'seen': 2, 'correct': 'a', 'incorrect': 0, 'streak': 0}):
+        assert weight(stats) == adaptive_scheduler.UNSEEN_WEIGHT
+
+
+def test_malformed_profile_does_not_crash(tmp_path):
+    bank = {'Vascular Neurology': [{'id': 1}, {'id': 2}]}
+    path = tmp_path / 'profile.json'
+    path.write_text(json.dumps({'Vascular Neurology::1': 5}), encoding='utf-8')
+    session = adaptive_scheduler.schedule_session(bank, adaptive_scheduler.load_profile(str(path)), 2)
+    assert len(session) == 2
+
+    path.write_text(json.dumps([1, 2, 3]), encoding='utf-8')
+    assert adaptive_scheduler.load_profile(str(path)) == {}
+
+
+def test_schedule_session_uses_profile_keys():
+    bank = {'Tema': [{'id': 1}, {'id': 2}, {'id': 3}]}
+    session = adaptive_scheduler.schedule_session(bank, {}, 3)
+    assert sorted(session) == ['Tema::1', 'Tema::2', 'Tema::3']
+
+
+NODE_SCRIPT = """
+import { weightedSample, questionWeight, questionKey, validateProfile } from %s;
+const cases = %s;
+let coverage = true;
+for (let t = 0; t < 500; t++) {
+    const n = 1 + Math.floor(Math.random() * 40);
+    const items = [...Array(n).keys()];
+    const weights = items.map(() => 0.01 + Math.random() * 5);
+    const drawn = weightedSample(items, weights, n).sort((a, b) => a - b);
+    if (drawn.join() !== items.join()) coverage = false;
+}
+let zeros = true;
+for (let t = 0; t < 500; t++) {
+    const drawn = weightedSample([0, 1, 2, 3, 4, 5, 6], [0, 2, 0, 1, 0, 3, 0], 7).sort();
+    if (drawn.join() !== '1,3,5') zeros = false;
+}
+const validated = validateProfile({
+    ok: { seen: 1, correct: 1, incorrect: 0, streak: 1, extra: 'x' },
+    number: 5,
+    list: [1],
+    text: { seen: '1', correct: 0, incorrect: 0, streak: 0 },
+    missing: { seen: 1 },
+});
+const rejected = [[], 'texto', null, 3].every(data => {
+    try { validateProfile(data); return false; } catch (e) { return true; }
+});
+console.log(JSON.stringify({
+    validated,
+    rejected,
+    coverage,
+    zeros,
+    weights: cases.map(questionWeight),
+    key: questionKey('Tema', { id: 7 }),
+}));
+"""
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node not installed')
+def test_js_scheduler_matches_python(tmp_path):
+    module_url = (ROOT / 'scheduler.js').as_uri()
+    script = tmp_path / 'check.mjs'
+    script.write_text(NODE_SCRIPT % (json.dumps(module_url), json.dumps(STATS_CASES)))
+    result = subprocess.run(['node', str(script)], capture_output=True, text=True, check=True)
+    output = json.loads(result.stdout)
+
+    assert output['coverage']
+    assert output['zeros']
+    expected = [adaptive_scheduler.question_weight(stats) for stats in STATS_CASES]
+    assert output['weights'] == pytest.approx(expected)
+    assert output['key'] == adaptive_scheduler.question_key('Tema', {'id': 7})
+    assert output['validated'] == {
+        'entries': {'ok': {'seen': 1, 'correct': 1, 'incorrect': 0, 'streak': 1}},
+        'skipped': 4,
+    }
+    assert output['rejected']
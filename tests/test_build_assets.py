@@ -0,0 +1,71 @@
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+import build_assets
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCES = ['index.html', 'sw.js', 'scheduler.js', 'styles.css']
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    for name in SOURCES:
+        shutil.copy(ROOT / name, tmp_path / name)
+    bank = {'Tema A': [{'id': 1}], 'Tema B': [{'id': 2}, {'id': 3}]}
+    (tmp_path / 'bank.json').write_text(json.dumps(bank), encoding='utf-8')
+
+    # CLI falso do Tailwind: os testes não dependem de Node nem de rede
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    tailwind = bin_dir / 'tailwindcss'
+    tailwind.write_text('#!/bin/sh\necho "body{margin:0}"\n')
+    tailwind.chmod(0o755)
+    monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='stub tailwindcss is a shell script')
+def test_manifest_precache_paths_exist(workdir, monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['build_assets.py', 'bank.json'])
+    build_assets.main()
+
+    dist = workdir / 'dist'
+    manifest = json.loads((dist / 'asset-manifest.json').read_text(encoding='utf-8'))
+    for path in manifest['precache']:
+        target = dist / ('index.html' if path == './' else path)
+        assert target.is_file(), path
+
+    assert [shard['nome'] for shard in manifest['bank']] == ['Tema A', 'Tema B']
+    assert (dist / 'sw.js').is_file()
+    assert (dist / (manifest['assets']['styles.css'] + '.gz')).is_file()
+
+    html = (dist / 'index.html').read_text(encoding='utf-8')
+    assert build_assets.TAILWIND_CDN_TAG not in html
+    assert manifest['assets']['styles.css'] in html
+    assert manifest['assets']['scheduler.js'] in html
+    assert build_assets.SCHEDULER_IMPORT not in html
+
+
+def test_missing_bank_fails_without_output(workdir, monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['build_assets.py', 'missing.json'])
+    with pytest.raises(SystemExit):
+        build_assets.main()
+    assert not (workdir / 'dist').exists()
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='stub tailwindcss is a shell script')
+def test_missing_scheduler_import_fails(workdir, monkeypatch):
+    index = workdir / 'index.html'
+    html = index.read_text(encoding='utf-8')
+    index.write_text(html.replace(build_assets.SCHEDULER_IMPORT, "import('./outro.js')"), encoding='utf-8')
+
+    monkeypatch.setattr(sys, 'argv', ['build_assets.py', 'bank.json'])
+    with pytest.raises(SystemExit):
+        build_assets.main()